@@ -0,0 +1,3 @@
+"""Zoidberg's Running Coach — Garmin-powered half marathon training analysis."""
+
+__version__ = "0.1.0"
@@ -0,0 +1,6 @@
+"""Module entrypoint for ``python -m zoidberg_coach``."""
+
+from zoidberg_coach.cli import app
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,467 @@
+"""Training-load analysis over normalized Garmin activities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+from zoidberg_coach.models import Activity, as_activities
+
+try:  # Numba is optional; the NumPy reductions below are the fallback.
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+METERS_PER_MILE = 1609.344
+# Multiplying by the reciprocal avoids a divide in every per-activity loop.
+MILES_PER_METER = 1.0 / METERS_PER_MILE
+DEFAULT_ZONE_BOUNDARY_HR = 150
+HARD_EFFORT_HR = 150
+MAX_WEEKLY_INCREASE_PCT = 10.0
+EASY_PCT_TARGET = 80.0
+DEFAULT_DAYS_SINCE_HARD = 7
+
+# Below this many activities the NumPy array conversion costs more than it
+# saves; use the plain single-pass accumulator loop instead.
+VECTORIZE_THRESHOLD = 64
+
+
+def _normalize_activities(activities: list[Any]) -> list[Activity]:
+    """Coerce raw activity dicts to :class:`Activity` records.
+
+    The record precomputes the parsed date and run flag at construction,
+    so downstream analysis never re-parses strings or re-hashes dict
+    keys. Idempotent; records pass through untouched.
+    """
+    return as_activities(activities)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _weekly_reduce(date_ord, dist, dur, is_run, sunday_ord, weeks):
+        """LLVM-compiled single-pass weekly bucket reduction."""
+        meters = np.zeros(weeks)
+        seconds = np.zeros(weeks)
+        counts = np.zeros(weeks, np.int64)
+        for i in range(date_ord.size):
+            if not is_run[i]:
+                continue
+            w = (sunday_ord - date_ord[i]) // 7
+            if 0 <= w < weeks:
+                meters[w] += dist[i]
+                seconds[w] += dur[i]
+                counts[w] += 1
+        return meters, seconds, counts
+
+    @njit(cache=True)
+    def _pace_batch(dur, dist):
+        """LLVM-compiled pace split: seconds-per-mile as (minutes, seconds).
+
+        Rows with non-positive duration or sub-meter distance get
+        minutes == -1 so the caller can render them as undefined,
+        matching the scalar formatter's rounding guard.
+        """
+        n = dur.size
+        mins = np.empty(n, np.int32)
+        secs = np.empty(n, np.int32)
+        for i in range(n):
+            if dur[i] <= 0 or dist[i] < 0.5:
+                mins[i] = -1
+                secs[i] = 0
+                continue
+            spm = dur[i] * METERS_PER_MILE / dist[i]
+            m = int(spm // 60)
+            s = int(round(spm - 60.0 * m))
+            if s == 60:
+                m += 1
+                s = 0
+            mins[i] = m
+            secs[i] = s
+        return mins, secs
+
+
+def _weekly_totals_vectorized(
+    activities: list[Activity], current_sunday: date, weeks: int
+) -> tuple[Any, Any, Any]:
+    """Bucket-sum miles, seconds, and run counts over typed arrays.
+
+    Uses the Numba kernel when available, otherwise ``np.bincount``.
+    Malformed dates carry ordinal 0, which lands far outside the week
+    window and is dropped by the range check in either path.
+    """
+    n = len(activities)
+    date_ord = np.fromiter(
+        (a.day.toordinal() if a.day is not None else 0 for a in activities),
+        dtype=np.int64,
+        count=n,
+    )
+    dist = np.fromiter((a.distance for a in activities), dtype=np.float64, count=n)
+    dur = np.fromiter((a.duration for a in activities), dtype=np.float64, count=n)
+    is_run = np.fromiter((a.is_run for a in activities), dtype=bool, count=n)
+    sunday_ord = current_sunday.toordinal()
+
+    if njit is not None:
+        meters, seconds, counts = _weekly_reduce(
+            date_ord, dist, dur, is_run, sunday_ord, weeks
+        )
+        return meters * MILES_PER_METER, seconds, counts
+
+    week_idx = (sunday_ord - date_ord) // 7
+    valid = is_run & (week_idx >= 0) & (week_idx < weeks)
+    idx = week_idx[valid]
+    miles = np.bincount(idx, weights=dist[valid], minlength=weeks) * MILES_PER_METER
+    seconds = np.bincount(idx, weights=dur[valid], minlength=weeks)
+    counts = np.bincount(idx, minlength=weeks).astype(np.int64)
+    return miles, seconds, counts
+
+
+def _weekly_totals_loop(
+    activities: list[Activity], current_sunday: date, weeks: int
+) -> tuple[list[float], list[float], list[int]]:
+    """Single-pass accumulator bucketing for small activity lists.
+
+    Parses each date exactly once and accumulates into pre-allocated
+    per-week buckets, instead of filtering the full list once per week.
+    """
+    miles = [0.0] * weeks
+    seconds = [0.0] * weeks
+    counts = [0] * weeks
+    for a in activities:
+        if not a.is_run:
+            continue
+        d = a.day
+        if d is None:
+            continue
+        w = (current_sunday - d).days // 7
+        if 0 <= w < weeks:
+            miles[w] += a.distance * MILES_PER_METER
+            seconds[w] += a.duration
+            counts[w] += 1
+    return miles, seconds, counts
+
+
+def _week_start_table(current_monday: date, weeks: int) -> list[str]:
+    """Precompute the week-start ISO strings, newest week first."""
+    return [(current_monday - timedelta(weeks=w)).isoformat() for w in range(weeks)]
+
+
+@dataclass(slots=True)
+class TrainingAggregate:
+    """Per-week training totals built from one pass over the activities.
+
+    Commands that need several analyses over the same window (like
+    ``daily-report``) build this once and hand it to ``weekly_summary``
+    and ``polarization_analysis`` instead of re-scanning the activity list
+    per analysis. Index 0 is the current (Monday-anchored) week. The
+    easy/hard split is fixed at build time, so the boundary it was built
+    with is recorded for consumers to check against.
+    """
+
+    week_start_iso: list[str]
+    miles: list[float]
+    seconds: list[float]
+    counts: list[int]
+    easy_seconds: list[float]
+    hard_seconds: list[float]
+    zone_boundary_hr: int = DEFAULT_ZONE_BOUNDARY_HR
+
+
+def build_training_aggregate(
+    activities: list[Any],
+    weeks: int = 8,
+    zone_boundary_hr: int = DEFAULT_ZONE_BOUNDARY_HR,
+) -> TrainingAggregate:
+    """Bucket mileage, time, counts, and easy/hard seconds in one pass."""
+    today = date.today()
+    current_monday = today - timedelta(days=today.weekday())
+    current_sunday = current_monday + timedelta(days=6)
+
+    miles = [0.0] * weeks
+    seconds = [0.0] * weeks
+    counts = [0] * weeks
+    easy = [0.0] * weeks
+    hard = [0.0] * weeks
+    for a in _normalize_activities(activities):
+        if not a.is_run:
+            continue
+        d = a.day
+        if d is None:
+            continue
+        w = (current_sunday - d).days // 7
+        if not 0 <= w < weeks:
+            continue
+        duration = a.duration
+        miles[w] += a.distance * MILES_PER_METER
+        seconds[w] += duration
+        counts[w] += 1
+        avg_hr = a.avg_hr
+        if duration > 0 and avg_hr > 0:
+            if avg_hr < zone_boundary_hr:
+                easy[w] += duration
+            else:
+                hard[w] += duration
+    week_start_iso = _week_start_table(current_monday, weeks)
+    return TrainingAggregate(
+        week_start_iso, miles, seconds, counts, easy, hard, zone_boundary_hr
+    )
+
+
+def weekly_summary(
+    activities: list[Any] | TrainingAggregate, weeks: int = 8
+) -> list[dict[str, Any]]:
+    """Aggregate running mileage, time, and run count per calendar week.
+
+    Weeks run Monday through Sunday; index 0 is the current week. The
+    aggregation is a single pass over the activities: each date is parsed
+    once and bucketed by week index, anchored on this week's Sunday so that
+    every day of the current week lands in bucket 0. Large lists go through
+    the ``np.bincount`` reduction; small ones use a plain accumulator loop.
+    A pre-built :class:`TrainingAggregate` is accepted in place of the raw
+    list, in which case no scan happens at all.
+    """
+    if isinstance(activities, TrainingAggregate):
+        agg = activities
+        weeks = min(weeks, len(agg.week_start_iso))
+        return [
+            {
+                "week_start": agg.week_start_iso[w],
+                "total_miles": round(float(agg.miles[w]), 2),
+                "total_seconds": float(agg.seconds[w]),
+                "runs": int(agg.counts[w]),
+            }
+            for w in range(weeks)
+        ]
+
+    today = date.today()
+    current_monday = today - timedelta(days=today.weekday())
+    current_sunday = current_monday + timedelta(days=6)
+
+    # Runs older than the analysis window cannot land in any bucket, so
+    # drop them (and non-runs) once up front rather than re-testing them
+    # inside the reduction — callers routinely pass 60 days of history
+    # through a 4-week analysis.
+    oldest = current_monday - timedelta(weeks=weeks - 1)
+    relevant = [
+        a
+        for a in _normalize_activities(activities)
+        if a.is_run and a.day is not None and oldest <= a.day <= current_sunday
+    ]
+    if not relevant:
+        miles: Any = [0.0] * weeks
+        seconds: Any = [0.0] * weeks
+        counts: Any = [0] * weeks
+    elif len(relevant) < VECTORIZE_THRESHOLD:
+        miles, seconds, counts = _weekly_totals_loop(relevant, current_sunday, weeks)
+    else:
+        miles, seconds, counts = _weekly_totals_vectorized(
+            relevant, current_sunday, weeks
+        )
+
+    week_start_iso = _week_start_table(current_monday, weeks)
+    return [
+        {
+            "week_start": week_start_iso[w],
+            "total_miles": round(float(miles[w]), 2),
+            "total_seconds": float(seconds[w]),
+            "runs": int(counts[w]),
+        }
+        for w in range(weeks)
+    ]
+
+
+# Structured-array layout for weekly_summary_arr: day is the proleptic
+# ordinal (date.toordinal()), distance in meters, duration in seconds.
+RUN_DTYPE = np.dtype(
+    [
+        ("day", np.int64),
+        ("dist_m", np.float64),
+        ("dur_s", np.float64),
+        ("hr", np.float64),
+    ]
+)
+
+
+def weekly_summary_arr(runs: np.ndarray, weeks: int = 8) -> list[dict[str, Any]]:
+    """Weekly summary over a :data:`RUN_DTYPE` structured array.
+
+    Array-native counterpart of :func:`weekly_summary` for callers that
+    already hold their runs as a contiguous structured array: the whole
+    aggregation is three ``np.bincount`` reductions over the buffer with
+    no per-row Python objects. Every row is assumed to be a run; the
+    output shape matches :func:`weekly_summary`.
+    """
+    today = date.today()
+    current_monday = today - timedelta(days=today.weekday())
+    current_sunday = current_monday + timedelta(days=6)
+
+    week_idx = (current_sunday.toordinal() - runs["day"]) // 7
+    valid = (week_idx >= 0) & (week_idx < weeks)
+    idx = week_idx[valid]
+    miles = (
+        np.bincount(idx, weights=runs["dist_m"][valid], minlength=weeks)
+        * MILES_PER_METER
+    )
+    seconds = np.bincount(idx, weights=runs["dur_s"][valid], minlength=weeks)
+    counts = np.bincount(idx, minlength=weeks)
+
+    week_start_iso = _week_start_table(current_monday, weeks)
+    return [
+        {
+            "week_start": week_start_iso[w],
+            "total_miles": round(float(miles[w]), 2),
+            "total_seconds": float(seconds[w]),
+            "runs": int(counts[w]),
+        }
+        for w in range(weeks)
+    ]
+
+
+def polarization_analysis(
+    activities: list[Any] | TrainingAggregate,
+    weeks: int = 4,
+    zone_boundary_hr: int = DEFAULT_ZONE_BOUNDARY_HR,
+) -> dict[str, Any]:
+    """Split recent running time into easy vs hard by average heart rate.
+
+    The 80/20 rule: roughly 80% of training time should sit below the
+    easy/hard boundary (default Zone 3 onset around 150 bpm).
+
+    A pre-built :class:`TrainingAggregate` has its easy/hard split fixed
+    at build time, so passing one with a different ``zone_boundary_hr``
+    raises ``ValueError``. The two input forms also window differently:
+    the aggregate sums whole Monday-anchored weeks, while the raw-list
+    path uses a rolling ``today - weeks`` cutoff, so their totals can
+    differ for the same activities.
+    """
+    if isinstance(activities, TrainingAggregate):
+        if zone_boundary_hr != activities.zone_boundary_hr:
+            raise ValueError(
+                f"aggregate was built with zone_boundary_hr="
+                f"{activities.zone_boundary_hr}; cannot re-split at "
+                f"{zone_boundary_hr}"
+            )
+        weeks = min(weeks, len(activities.week_start_iso))
+        return _polarization_result(
+            float(sum(activities.easy_seconds[:weeks])),
+            float(sum(activities.hard_seconds[:weeks])),
+        )
+
+    today = date.today()
+    cutoff = today - timedelta(weeks=weeks)
+    easy_seconds = 0.0
+    hard_seconds = 0.0
+    activities = _normalize_activities(activities)
+    if len(activities) >= VECTORIZE_THRESHOLD:
+        n = len(activities)
+        date_ord = np.fromiter(
+            (a.day.toordinal() if a.day is not None else 0 for a in activities),
+            dtype=np.int64,
+            count=n,
+        )
+        dur = np.fromiter((a.duration for a in activities), dtype=np.float64, count=n)
+        hr = np.fromiter((a.avg_hr for a in activities), dtype=np.float64, count=n)
+        is_run = np.fromiter((a.is_run for a in activities), dtype=bool, count=n)
+        mask = (
+            is_run
+            & (date_ord >= cutoff.toordinal())
+            & (date_ord <= today.toordinal())
+            & (dur > 0)
+            & (hr > 0)
+        )
+        easy_seconds = float(dur[mask & (hr < zone_boundary_hr)].sum())
+        hard_seconds = float(dur[mask].sum()) - easy_seconds
+    else:
+        for a in activities:
+            if not a.is_run:
+                continue
+            d = a.day
+            if d is None or not cutoff <= d <= today:
+                continue
+            duration = a.duration
+            avg_hr = a.avg_hr
+            if duration <= 0 or avg_hr <= 0:
+                continue
+            if avg_hr < zone_boundary_hr:
+                easy_seconds += duration
+            else:
+                hard_seconds += duration
+
+    return _polarization_result(easy_seconds, hard_seconds)
+
+
+def _polarization_result(easy_seconds: float, hard_seconds: float) -> dict[str, Any]:
+    """Shape easy/hard totals into the polarization result dict."""
+    total = easy_seconds + hard_seconds
+    if total <= 0:
+        return {
+            "easy_pct": 0.0,
+            "hard_pct": 0.0,
+            "easy_seconds": 0.0,
+            "hard_seconds": 0.0,
+            "recommendation": "No heart rate data available for recent runs.",
+        }
+    easy_pct = easy_seconds / total * 100.0
+    if easy_pct >= EASY_PCT_TARGET - 5:
+        recommendation = "Good polarization — keep most running easy."
+    else:
+        recommendation = (
+            "Too much intensity — shift volume toward easy Zone 1-2 running "
+            "(80/20 rule)."
+        )
+    return {
+        "easy_pct": round(easy_pct, 1),
+        "hard_pct": round(100.0 - easy_pct, 1),
+        "easy_seconds": easy_seconds,
+        "hard_seconds": hard_seconds,
+        "recommendation": recommendation,
+    }
+
+
+def training_load_trend(summaries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Annotate weekly summaries with week-over-week mileage change.
+
+    Expects summaries ordered most recent first (as ``weekly_summary``
+    returns them) and flags any week that increased more than
+    ``MAX_WEEKLY_INCREASE_PCT`` over the week before it.
+    """
+    if not summaries:
+        return []
+    miles = np.array([s["total_miles"] for s in summaries], dtype=np.float64)
+    prev = np.concatenate([miles[1:], [0.0]])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        increase = np.where(prev > 0, (miles - prev) / prev * 100.0, 0.0)
+    flags = increase > MAX_WEEKLY_INCREASE_PCT
+    increase = np.round(increase, 1)
+    return [
+        {
+            **summary,
+            "mileage_increase_pct": float(increase[i]),
+            "overload_flag": bool(flags[i]),
+        }
+        for i, summary in enumerate(summaries)
+    ]
+
+
+def _days_since_hard_effort(
+    activities: list[Any], hr_threshold: int = HARD_EFFORT_HR
+) -> int:
+    """Days since the most recent run at or above ``hr_threshold`` avg HR."""
+    today = date.today()
+    latest: date | None = None
+    for a in _normalize_activities(activities):
+        if not a.is_run:
+            continue
+        if a.avg_hr < hr_threshold:
+            continue
+        d = a.day
+        if d is None:
+            continue
+        if latest is None or d > latest:
+            latest = d
+    if latest is None:
+        return DEFAULT_DAYS_SINCE_HARD
+    return (today - latest).days
@@ -0,0 +1,559 @@
+"""Typer CLI for Zoidberg's Running Coach."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Optional
+
+import typer
+
+from zoidberg_coach import __version__
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from zoidberg_coach.garmin_client import GarminClient
+
+# rich, numpy (via analysis), and garth (via garmin_client) are deferred to
+# the commands that need them so `--help`/`--version` don't pay their import
+# cost.
+
+PATTERN_RECOVERY_DAYS = 14
+REPORT_HISTORY_DAYS = 7
+MAX_FETCH_WORKERS = 8
+REPORT_ACTIVITY_DAYS = 60
+TODAY_ACTIVITY_DAYS = 28
+
+app = typer.Typer(
+    help="Garmin-powered half marathon training coach.", no_args_is_help=True
+)
+
+_CONSOLE: "Console | None" = None
+
+
+def _console() -> "Console":
+    """Shared rich console, created on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+def _get_client() -> "GarminClient":
+    """Build an authenticated Garmin client or exit with a friendly error."""
+    from zoidberg_coach.garmin_client import GarminAuthenticationError, GarminClient
+
+    try:
+        return GarminClient()
+    except GarminAuthenticationError as exc:
+        _console().print(f"[red]Error:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+
+def _auth_guard(command):
+    """Exit cleanly when Garmin authentication fails mid-command.
+
+    Construction-time failures are handled in _get_client, but a token
+    can expire between construction and the first API call; commands
+    wrapped here turn that into the same friendly error and exit code.
+    """
+
+    @wraps(command)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        from zoidberg_coach.garmin_client import GarminAuthenticationError
+
+        try:
+            return command(*args, **kwargs)
+        except GarminAuthenticationError as exc:
+            _console().print(f"[red]Error:[/red] {exc}")
+            raise typer.Exit(code=1)
+
+    return wrapper
+
+
+def _fetch_recovery(client: "GarminClient", day: date | None = None) -> dict[str, Any]:
+    """Fetch sleep, HRV, body battery, and stress for a day in parallel.
+
+    The four calls are independent round trips, so total latency is the
+    slowest one instead of the sum.
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            "sleep": executor.submit(client.get_sleep, day),
+            "hrv": executor.submit(client.get_hrv, day),
+            "body_battery": executor.submit(client.get_body_battery, day),
+            "stress": executor.submit(client.get_stress, day),
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _parse_date_arg(date_str: str | None) -> date:
+    """Parse an optional YYYY-MM-DD argument, defaulting to today."""
+    if not date_str:
+        return date.today()
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        _console().print(f"[red]Invalid date:[/red] {date_str} (expected YYYY-MM-DD)")
+        raise typer.Exit(code=1)
+
+
+@lru_cache(maxsize=4096)
+def _format_pace_cached(duration: int, distance: int) -> str:
+    from zoidberg_coach.analysis import METERS_PER_MILE
+
+    total = round(duration * METERS_PER_MILE / distance)
+    minutes, seconds = divmod(total, 60)
+    return f"{minutes}:{seconds:02d}/mi"
+
+
+def _format_pace(duration_seconds: float, distance_meters: float) -> str:
+    """Format pace as M:SS per mile, or ``--`` when undefined."""
+    if duration_seconds <= 0 or distance_meters <= 0:
+        return "--"
+    # Round float inputs at the boundary so the cache keys on small ints;
+    # split rows repeat the same rounded pairs constantly. A sub-meter
+    # split rounds down to zero distance — treat it as undefined rather
+    # than dividing by it.
+    distance = round(distance_meters)
+    if distance == 0:
+        return "--"
+    return _format_pace_cached(round(duration_seconds), distance)
+
+
+def _format_pace_rows(durations: list[float], distances: list[float]) -> list[str]:
+    """Format a column of paces, batching through Numba when it pays off.
+
+    Long activities can carry hundreds of splits; the compiled kernel keeps
+    the divmod arithmetic out of the interpreter and leaves only the final
+    f-string join in Python. Short tables use the cached scalar path.
+    """
+    from zoidberg_coach import analysis
+
+    if analysis.njit is not None and len(durations) >= analysis.VECTORIZE_THRESHOLD:
+        import numpy as np
+
+        mins, secs = analysis._pace_batch(
+            np.asarray(durations, dtype=np.float64),
+            np.asarray(distances, dtype=np.float64),
+        )
+        return [
+            "--" if m < 0 else f"{m}:{s:02d}/mi"
+            for m, s in zip(mins.tolist(), secs.tolist())
+        ]
+    return [_format_pace(d, m) for d, m in zip(durations, distances)]
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as H:MM:SS (or M:SS under an hour)."""
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def _dump_json(obj: Any) -> str:
+    """Serialize a report to indented JSON, via orjson when available."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2, default=str)
+    return orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str
+    ).decode()
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        typer.echo(f"zoidberg-coach {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    version: bool = typer.Option(
+        False,
+        "--version",
+        callback=_version_callback,
+        is_eager=True,
+        help="Show version and exit.",
+    ),
+) -> None:
+    """Zoidberg's Running Coach — Garmin training analysis for the half marathon."""
+
+
+@app.command()
+@_auth_guard
+def activities(
+    days: int = typer.Option(30, "--days", help="How many days back to list."),
+) -> None:
+    """List recent activities with distance, time, and pace."""
+    from rich.table import Table
+
+    from zoidberg_coach.analysis import MILES_PER_METER
+
+    client = _get_client()
+    items = client.get_activities(days=days)
+    if not items:
+        _console().print("No activities found.")
+        return
+    table = Table(title=f"Activities — last {days} days")
+    table.add_column("Date")
+    table.add_column("Name")
+    table.add_column("Type")
+    table.add_column("Distance", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Pace", justify="right")
+    for a in items:
+        table.add_row(
+            a.date,
+            a.name,
+            a.type,
+            f"{a.distance * MILES_PER_METER:.1f} mi",
+            _format_duration(a.duration),
+            _format_pace(a.duration, a.distance),
+        )
+    _console().print(table)
+
+
+@app.command()
+@_auth_guard
+def activity(
+    activity_id: int = typer.Argument(..., help="Garmin activity id."),
+) -> None:
+    """Show lap-by-lap detail for one activity."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from zoidberg_coach.analysis import MILES_PER_METER
+
+    client = _get_client()
+    detail = client.get_activity_details(activity_id)
+    miles = float(detail.get("distance", 0) or 0) * MILES_PER_METER
+    _console().print(
+        Panel(
+            f"[bold]{detail.get('name', 'Activity')}[/bold] — "
+            f"{detail.get('date', '')}\n"
+            f"{miles:.1f} mi in {_format_duration(float(detail.get('duration', 0) or 0))}",
+            title="Activity",
+        )
+    )
+    laps = detail.get("laps", [])
+    if not laps:
+        _console().print("No lap data.")
+        return
+    table = Table(title="Splits")
+    table.add_column("Lap", justify="right")
+    table.add_column("Distance", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Pace", justify="right")
+    table.add_column("Avg HR", justify="right")
+    lap_dists = [float(lap.get("distance", 0) or 0) for lap in laps]
+    lap_durs = [float(lap.get("duration", 0) or 0) for lap in laps]
+    paces = _format_pace_rows(lap_durs, lap_dists)
+    for i, lap in enumerate(laps):
+        avg_hr = float(lap.get("avg_hr", 0) or 0)
+        table.add_row(
+            str(i + 1),
+            f"{lap_dists[i] * MILES_PER_METER:.2f} mi",
+            _format_duration(lap_durs[i]),
+            paces[i],
+            f"{avg_hr:.0f}" if avg_hr else "--",
+        )
+    _console().print(table)
+
+
+@app.command()
+@_auth_guard
+def recovery(
+    day: Optional[str] = typer.Argument(None, help="Date (YYYY-MM-DD), default today."),
+) -> None:
+    """Show sleep, HRV, body battery, and stress for a day."""
+    from rich.panel import Panel
+
+    target = _parse_date_arg(day)
+    client = _get_client()
+    metrics = _fetch_recovery(client, target)
+    sleep = metrics["sleep"]
+    hrv = metrics["hrv"]
+    battery = metrics["body_battery"]
+    stress = metrics["stress"]
+    lines = [
+        f"Sleep score:   {sleep.get('score', 0)}",
+        f"HRV:           {hrv.get('last_night_avg', 0):.0f} ms "
+        f"(baseline {hrv.get('weekly_avg', 0):.0f}, {hrv.get('status', 'unknown')})",
+        f"Body battery:  {battery.get('current', 0)} "
+        f"(high {battery.get('high', 0)}, low {battery.get('low', 0)})",
+        f"Stress:        {stress.get('overall', 0)}",
+    ]
+    _console().print(Panel("\n".join(lines), title=f"Recovery — {target.isoformat()}"))
+
+
+@app.command()
+@_auth_guard
+def summary(
+    weeks: int = typer.Option(8, "--weeks", help="How many weeks to summarize."),
+) -> None:
+    """Weekly mileage summary with overload flags."""
+    from rich.table import Table
+
+    from zoidberg_coach.analysis import (
+        _normalize_activities,
+        training_load_trend,
+        weekly_summary,
+    )
+
+    client = _get_client()
+    acts = _normalize_activities(client.get_activities(days=weeks * 7 + 7))
+    summaries = training_load_trend(weekly_summary(acts, weeks=weeks))
+    table = Table(title=f"Weekly training — last {weeks} weeks")
+    table.add_column("Week of")
+    table.add_column("Miles", justify="right")
+    table.add_column("Runs", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Change", justify="right")
+    for s in summaries:
+        change = f"{s['mileage_increase_pct']:+.1f}%"
+        if s["overload_flag"]:
+            change = f"[red]{change} ⚠[/red]"
+        table.add_row(
+            s["week_start"],
+            f"{s['total_miles']:.1f}",
+            str(s["runs"]),
+            _format_duration(s["total_seconds"]),
+            change,
+        )
+    _console().print(table)
+
+
+@app.command()
+@_auth_guard
+def today() -> None:
+    """Readiness check and a workout suggestion for today."""
+    from rich.panel import Panel
+
+    from zoidberg_coach.analysis import (
+        _days_since_hard_effort,
+        _normalize_activities,
+        weekly_summary,
+    )
+    from zoidberg_coach.coaching import readiness_score, suggest_workout
+
+    client = _get_client()
+    metrics = _fetch_recovery(client)
+    sleep = metrics["sleep"]
+    hrv = metrics["hrv"]
+    battery = metrics["body_battery"]
+    stress = metrics["stress"]
+    acts = _normalize_activities(client.get_activities(days=TODAY_ACTIVITY_DAYS))
+    summaries = weekly_summary(acts, weeks=4)
+    days_hard = _days_since_hard_effort(acts)
+    readiness = readiness_score(
+        sleep_score=float(sleep.get("score", 0) or 0),
+        hrv_last_night=float(hrv.get("last_night_avg", 0) or 0),
+        hrv_baseline=float(hrv.get("weekly_avg", 0) or 0),
+        body_battery=float(battery.get("current", 0) or 0),
+        stress_avg=float(stress.get("overall", 0) or 0),
+        days_since_hard=days_hard,
+    )
+    miles_per_week = [s["total_miles"] for s in summaries]
+    avg_miles = sum(miles_per_week) / len(miles_per_week) if miles_per_week else 0.0
+    suggestion = suggest_workout(readiness["score"], summaries, days_hard)
+    readiness_lines = [
+        f"Readiness: [bold]{readiness['score']}[/bold]/100 — "
+        f"{readiness['interpretation']}"
+    ]
+    readiness_lines.extend(f"• {factor}" for factor in readiness["factors"])
+    _console().print(Panel("\n".join(readiness_lines), title="Today"))
+    _console().print(
+        Panel(
+            f"[bold]{suggestion['workout']}[/bold]\n"
+            f"{suggestion['details']}\n{suggestion['reason']}\n"
+            f"Recent volume: {avg_miles:.1f} mi/week",
+            title="Suggested workout",
+        )
+    )
+
+
+@app.command()
+@_auth_guard
+def patterns(
+    weeks: int = typer.Option(8, "--weeks", help="How many weeks to analyze."),
+) -> None:
+    """Detect training patterns: favorite days, pace by distance, sleep effects."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from zoidberg_coach.patterns import weekly_pattern_report
+
+    client = _get_client()
+    acts = client.get_activities(days=weeks * 7)
+    days_back = [
+        date.today() - timedelta(days=i)
+        for i in range(min(PATTERN_RECOVERY_DAYS, weeks * 7))
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        sleep_data = list(executor.map(client.get_sleep, days_back))
+        hrv_data = list(executor.map(client.get_hrv, days_back))
+    report = weekly_pattern_report(acts, sleep_data, hrv_data)
+    if not report["runs_analyzed"]:
+        _console().print("No runs found to analyze.")
+        return
+
+    lines = [f"Runs analyzed: {report['runs_analyzed']}"]
+    day_of_week = report["day_of_week"]
+    if day_of_week:
+        lines.append(f"Favorite day:  {day_of_week['favorite_day']}")
+        if day_of_week["fastest_day"]:
+            lines.append(f"Fastest day:   {day_of_week['fastest_day']}")
+    _console().print(Panel("\n".join(lines), title="Training patterns"))
+
+    distance_pace = report["distance_pace"]
+    if distance_pace:
+        table = Table(title="Pace by distance")
+        table.add_column("Bucket")
+        table.add_column("Runs", justify="right")
+        table.add_column("Avg pace", justify="right")
+        for bucket, stats in distance_pace.items():
+            pace = stats["avg_pace_s_per_mile"]
+            table.add_row(
+                bucket,
+                str(stats["runs"]),
+                f"{int(pace // 60)}:{int(pace % 60):02d}/mi",
+            )
+        _console().print(table)
+
+    correlation = report["sleep_correlation"]
+    if correlation:
+        good = correlation["avg_pace_good_sleep"]
+        poor = correlation["avg_pace_poor_sleep"]
+        _console().print(
+            Panel(
+                f"After good sleep: {int(good // 60)}:{int(good % 60):02d}/mi\n"
+                f"After poor sleep: {int(poor // 60)}:{int(poor % 60):02d}/mi\n"
+                f"Runs compared: {correlation['runs_compared']}",
+                title="Sleep & performance",
+            )
+        )
+    for signal in report["overtraining_signals"]:
+        _console().print(f"[yellow]⚠ {signal}[/yellow]")
+
+
+@app.command("daily-report")
+@_auth_guard
+def daily_report(
+    json_output: bool = typer.Option(False, "--json", help="Emit the report as JSON."),
+) -> None:
+    """Full morning report: recovery, load, polarization, and race readiness."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from zoidberg_coach.analysis import (
+        _days_since_hard_effort,
+        _normalize_activities,
+        build_training_aggregate,
+        polarization_analysis,
+        training_load_trend,
+        weekly_summary,
+    )
+    from zoidberg_coach.coaching import race_readiness, readiness_score, suggest_workout
+
+    client = _get_client()
+    metrics = _fetch_recovery(client)
+    sleep = metrics["sleep"]
+    hrv = metrics["hrv"]
+    battery = metrics["body_battery"]
+    stress = metrics["stress"]
+    acts = _normalize_activities(client.get_activities(days=REPORT_ACTIVITY_DAYS))
+    aggregate = build_training_aggregate(acts, weeks=8)
+    summaries = weekly_summary(aggregate, weeks=8)
+    trend = training_load_trend(summaries[:4])
+    polarization = polarization_analysis(aggregate, weeks=4)
+    race = race_readiness(acts)
+
+    # Today's sleep and HRV were already fetched above; only the prior
+    # days need a round trip, and sleep + HRV share one executor so all
+    # 12 requests are in flight at once instead of two serial batches.
+    prior_days = [
+        date.today() - timedelta(days=i) for i in range(1, REPORT_HISTORY_DAYS)
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        sleep_futures = [executor.submit(client.get_sleep, d) for d in prior_days]
+        hrv_futures = [executor.submit(client.get_hrv, d) for d in prior_days]
+        sleep_history = [sleep] + [f.result() for f in sleep_futures]
+        hrv_history = [hrv] + [f.result() for f in hrv_futures]
+
+    days_hard = _days_since_hard_effort(acts)
+    readiness = readiness_score(
+        sleep_score=float(sleep.get("score", 0) or 0),
+        hrv_last_night=float(hrv.get("last_night_avg", 0) or 0),
+        hrv_baseline=float(hrv.get("weekly_avg", 0) or 0),
+        body_battery=float(battery.get("current", 0) or 0),
+        stress_avg=float(stress.get("overall", 0) or 0),
+        days_since_hard=days_hard,
+    )
+    suggestion = suggest_workout(readiness["score"], summaries, days_hard)
+    report = {
+        "date": date.today().isoformat(),
+        "readiness": readiness,
+        "suggestion": suggestion,
+        "recovery": {
+            "sleep": sleep,
+            "hrv": hrv,
+            "body_battery": battery,
+            "stress": stress,
+        },
+        "recovery_history": {"sleep": sleep_history, "hrv": hrv_history},
+        "weekly_summaries": summaries,
+        "load_trend": trend,
+        "polarization": polarization,
+        "race_readiness": race,
+    }
+    if json_output:
+        typer.echo(_dump_json(report))
+        return
+
+    readiness_lines = [
+        f"Readiness: [bold]{readiness['score']}[/bold]/100 — "
+        f"{readiness['interpretation']}"
+    ]
+    readiness_lines.extend(f"• {factor}" for factor in readiness["factors"])
+    readiness_lines.append("")
+    readiness_lines.append(
+        f"[bold]{suggestion['workout']}[/bold] — {suggestion['details']}"
+    )
+    _console().print(Panel("\n".join(readiness_lines), title="Daily report"))
+
+    table = Table(title="Recent weeks")
+    table.add_column("Week of")
+    table.add_column("Miles", justify="right")
+    table.add_column("Runs", justify="right")
+    table.add_column("Change", justify="right")
+    for s in trend:
+        change = f"{s['mileage_increase_pct']:+.1f}%"
+        if s["overload_flag"]:
+            change = f"[red]{change} ⚠[/red]"
+        table.add_row(s["week_start"], f"{s['total_miles']:.1f}", str(s["runs"]), change)
+    _console().print(table)
+
+    _console().print(
+        Panel(
+            f"Easy: {polarization['easy_pct']:.0f}% / "
+            f"Hard: {polarization['hard_pct']:.0f}%\n"
+            f"{polarization['recommendation']}",
+            title="Polarization (4 weeks)",
+        )
+    )
+    race_lines = [
+        f"Readiness: {race['readiness_pct']:.0f}%",
+        f"Longest run: {race['longest_run_miles']:.1f} mi",
+        f"Avg weekly: {race['avg_weekly_miles']:.1f} mi",
+    ]
+    race_lines.extend(f"• {note}" for note in race["notes"])
+    _console().print(Panel("\n".join(race_lines), title="Half marathon readiness"))
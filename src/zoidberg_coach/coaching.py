@@ -0,0 +1,231 @@
+"""Readiness scoring, workout suggestions, and race readiness estimates."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+from zoidberg_coach.analysis import MILES_PER_METER, njit
+from zoidberg_coach.models import as_activities
+
+HALF_MARATHON_MILES = 13.1
+TARGET_LONG_RUN_MILES = 11.0
+TARGET_WEEKLY_MILES = 25.0
+MIN_RACE_PACE_DISTANCE_MILES = 3.0
+READINESS_WEEKS = 8
+
+READY_HARD_THRESHOLD = 80
+NORMAL_THRESHOLD = 60
+EASY_THRESHOLD = 40
+
+SLEEP_WEIGHT = 0.30
+HRV_WEIGHT = 0.30
+BATTERY_WEIGHT = 0.25
+STRESS_WEIGHT = 0.15
+HARD_EFFORT_TODAY_PENALTY = 10
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _race_metrics(dist, dur, ords, today_ord, min_pace_miles):
+        """Fused longest/weekly/best-pace reduction over the run arrays.
+
+        Returns best pace as -1.0 when no run qualifies, since the kernel
+        cannot return None.
+        """
+        longest = 0.0
+        weekly = np.zeros(4)
+        best_pace = -1.0
+        for i in range(dist.size):
+            miles = dist[i] * MILES_PER_METER
+            if miles > longest:
+                longest = miles
+            days_ago = today_ord - ords[i]
+            if 0 <= days_ago < 28:
+                weekly[days_ago // 7] += miles
+            if miles >= min_pace_miles and dur[i] > 0:
+                pace = dur[i] / miles
+                if best_pace < 0 or pace < best_pace:
+                    best_pace = pace
+        return longest, weekly, best_pace
+
+
+def _clamp(value: float, low: float = 0.0, high: float = 100.0) -> float:
+    return max(low, min(high, value))
+
+
+def readiness_score(
+    *,
+    sleep_score: float,
+    hrv_last_night: float,
+    hrv_baseline: float,
+    body_battery: float,
+    stress_avg: float,
+    days_since_hard: int,
+) -> dict[str, Any]:
+    """Combine recovery metrics into a 0-100 training readiness score.
+
+    Sleep and HRV carry the most weight; body battery and stress round it
+    out. A hard effort today knocks the score down to protect recovery.
+    """
+    factors: list[str] = []
+    sleep_component = _clamp(sleep_score)
+    if hrv_baseline > 0:
+        hrv_component = _clamp(hrv_last_night / hrv_baseline * 100.0)
+    else:
+        hrv_component = 50.0
+    battery_component = _clamp(body_battery)
+    stress_component = _clamp(100.0 - stress_avg)
+
+    score = (
+        SLEEP_WEIGHT * sleep_component
+        + HRV_WEIGHT * hrv_component
+        + BATTERY_WEIGHT * battery_component
+        + STRESS_WEIGHT * stress_component
+    )
+    if days_since_hard == 0:
+        score -= HARD_EFFORT_TODAY_PENALTY
+        factors.append("Hard effort today — extra recovery needed")
+    if sleep_component < 50:
+        factors.append("Poor sleep")
+    if hrv_component < 85:
+        factors.append("HRV below baseline")
+    if battery_component < 30:
+        factors.append("Body battery low")
+    if stress_component < 50:
+        factors.append("Elevated stress")
+
+    final = int(round(_clamp(score)))
+    if final >= READY_HARD_THRESHOLD:
+        interpretation = "Ready for hard effort"
+    elif final >= NORMAL_THRESHOLD:
+        interpretation = "Normal training"
+    elif final >= EASY_THRESHOLD:
+        interpretation = "Take it easy"
+    else:
+        interpretation = "Rest day recommended"
+    return {"score": final, "interpretation": interpretation, "factors": factors}
+
+
+def suggest_workout(
+    readiness: int,
+    weekly_summaries: list[dict[str, Any]],
+    days_since_hard: int,
+) -> dict[str, str]:
+    """Suggest today's workout from readiness and recent training load."""
+    recent_miles = weekly_summaries[0]["total_miles"] if weekly_summaries else 0.0
+    if readiness < EASY_THRESHOLD:
+        return {
+            "workout": "Rest day",
+            "details": "Full rest or gentle walking only.",
+            "reason": "Recovery metrics are low — training today digs the hole deeper.",
+        }
+    if readiness < NORMAL_THRESHOLD:
+        return {
+            "workout": "Recovery run",
+            "details": "20-30 min very easy in Zone 1.",
+            "reason": "Readiness is below normal; keep the effort conversational.",
+        }
+    if days_since_hard <= 1:
+        return {
+            "workout": "Easy run",
+            "details": "30-45 min in Zone 2.",
+            "reason": "Recent hard effort — absorb the work before the next one.",
+        }
+    if readiness >= READY_HARD_THRESHOLD:
+        return {
+            "workout": "Tempo run",
+            "details": f"15-25 min at Zone 3-4 with easy warmup/cooldown "
+            f"(recent volume {recent_miles:.1f} mi/week).",
+            "reason": "High readiness and fresh legs — a quality session fits.",
+        }
+    return {
+        "workout": "Easy run with strides",
+        "details": "40-50 min Zone 2 plus 4-6 x 20s strides.",
+        "reason": "Normal readiness — build aerobic volume with a touch of turnover.",
+    }
+
+
+def race_readiness(
+    activities: list[Any], race_date: date | None = None
+) -> dict[str, Any]:
+    """Estimate half marathon readiness from the last 8 weeks of running."""
+    today = date.today()
+    cutoff = today - timedelta(weeks=READINESS_WEEKS)
+    runs = [
+        a
+        for a in as_activities(activities)
+        if a.is_run and a.day is not None and a.day >= cutoff
+    ]
+    if not runs:
+        return {
+            "readiness_pct": 0.0,
+            "longest_run_miles": 0.0,
+            "avg_weekly_miles": 0.0,
+            "best_pace_s_per_mile": None,
+            "notes": ["No recent runs found."],
+        }
+
+    # Structure-of-arrays conversion: one pass over the dicts, then every
+    # metric below is a C-level array reduction instead of its own Python
+    # scan.
+    n = len(runs)
+    dist = np.fromiter((r.distance for r in runs), dtype=np.float64, count=n)
+    dur = np.fromiter((r.duration for r in runs), dtype=np.float64, count=n)
+    ords = np.fromiter((r.day.toordinal() for r in runs), dtype=np.int64, count=n)
+    best_pace: float | None = None
+    if njit is not None:
+        raw_longest, weekly, raw_best = _race_metrics(
+            dist, dur, ords, today.toordinal(), MIN_RACE_PACE_DISTANCE_MILES
+        )
+        longest = float(raw_longest)
+        weekly_totals = [float(total) for total in weekly]
+        if raw_best >= 0:
+            best_pace = float(raw_best)
+    else:
+        miles = dist * MILES_PER_METER
+
+        longest = float(miles.max())
+
+        # One bincount over the week indices replaces four masked
+        # re-scans; index 0 is the most recent 7 days.
+        week_idx = (today.toordinal() - ords) // 7
+        in_window = (week_idx >= 0) & (week_idx < 4)
+        totals = np.bincount(
+            week_idx[in_window], weights=miles[in_window], minlength=4
+        )
+        weekly_totals = [float(total) for total in totals]
+
+        pace_mask = (miles >= MIN_RACE_PACE_DISTANCE_MILES) & (dur > 0)
+        if pace_mask.any():
+            best_pace = float((dur[pace_mask] / miles[pace_mask]).min())
+    avg_weekly = sum(weekly_totals) / len(weekly_totals)
+
+    long_run_score = min(1.0, longest / TARGET_LONG_RUN_MILES)
+    volume_score = min(1.0, avg_weekly / TARGET_WEEKLY_MILES)
+    readiness_pct = round((0.5 * long_run_score + 0.5 * volume_score) * 100.0, 1)
+
+    notes: list[str] = []
+    if longest < TARGET_LONG_RUN_MILES:
+        notes.append(
+            f"Build the long run toward {TARGET_LONG_RUN_MILES:.0f} miles "
+            f"(currently {longest:.1f})."
+        )
+    if avg_weekly < TARGET_WEEKLY_MILES:
+        notes.append(
+            f"Build weekly volume toward {TARGET_WEEKLY_MILES:.0f} miles "
+            f"(currently {avg_weekly:.1f})."
+        )
+    if race_date is not None:
+        weeks_out = max(0, (race_date - today).days) // 7
+        if weeks_out <= 2:
+            notes.append("Inside the taper window — cut volume, keep intensity.")
+    return {
+        "readiness_pct": readiness_pct,
+        "longest_run_miles": round(longest, 1),
+        "avg_weekly_miles": round(avg_weekly, 1),
+        "best_pace_s_per_mile": best_pace,
+        "notes": notes,
+    }
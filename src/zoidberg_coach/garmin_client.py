@@ -0,0 +1,369 @@
+"""Garmin Connect client built on the garth library."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+import garth
+
+from zoidberg_coach.models import Activity
+
+GARMIN_DOMAIN = "garmin.com"
+GARTH_HOME = "~/.garth"
+ACTIVITY_PAGE_LIMIT = 200
+PER_DAY_CACHE_SIZE = 64
+MAX_PARALLEL_FETCHES = 8
+CACHE_DIR = Path.home() / ".cache" / "zoidberg"
+CACHE_DIR_ENV = "ZOIDBERG_CACHE_DIR"
+TODAY_CACHE_TTL_SECONDS = 3600.0
+
+
+class GarminAuthenticationError(Exception):
+    """Raised when no valid Garmin credentials are available."""
+
+
+def _normalize_activity(raw: dict[str, Any]) -> Activity:
+    """Flatten a raw Garmin activity payload into an Activity record."""
+    # Bind the bound method once; this runs for every activity on the
+    # ingestion path and each .get attribute lookup costs a dispatch.
+    _get = raw.get
+    activity_type = _get("activityType") or {}
+    type_str = str(activity_type.get("typeKey") or "unknown")
+    date_str = str(_get("startTimeLocal", ""))[:10]
+    try:
+        day: date | None = date.fromisoformat(date_str)
+    except ValueError:
+        day = None
+    return Activity(
+        id=_get("activityId"),
+        name=str(_get("activityName") or "Untitled"),
+        type=type_str,
+        date=date_str,
+        distance=float(_get("distance") or 0.0),
+        duration=float(_get("duration") or 0.0),
+        avg_hr=float(_get("averageHR") or 0.0),
+        max_hr=float(_get("maxHR") or 0.0),
+        day=day,
+        is_run="run" in type_str.lower(),
+    )
+
+
+def _is_empty_payload(payload: dict[str, Any]) -> bool:
+    """True when every field besides the date is a zero/unknown fallback.
+
+    The fetchers return zero-filled placeholder dicts when Garmin has no
+    data yet; caching those for a past date would permanently mask data
+    that syncs a day late.
+    """
+    return all(
+        not value or value == "unknown"
+        for key, value in payload.items()
+        if key != "date"
+    )
+
+
+class _DiskCache:
+    """SQLite-backed cache of per-date Garmin responses.
+
+    Sleep, HRV, body battery, and stress fetched after the day they
+    describe never change, so those entries are kept forever; a payload
+    fetched during its own day is a partial snapshot and expires after
+    an hour. The location defaults to
+    ``~/.cache/zoidberg`` and can be overridden via ``ZOIDBERG_CACHE_DIR``.
+    One connection is shared across the fetch threads behind a lock.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        if directory is None:
+            override = os.environ.get(CACHE_DIR_ENV)
+            directory = Path(override) if override else CACHE_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            directory / "responses.db", check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "endpoint TEXT NOT NULL, day TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, payload TEXT NOT NULL, "
+            "PRIMARY KEY (endpoint, day))"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, day: date) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, payload FROM responses "
+                "WHERE endpoint = ? AND day = ?",
+                (endpoint, day.isoformat()),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, payload = row
+        # An entry is final only if it was fetched on a later day than
+        # the one it describes; a snapshot taken during the day itself
+        # is partial (the watch keeps syncing), so it keeps the short
+        # TTL even after the date rolls over and gets refetched once
+        # the day's data has settled.
+        if (
+            date.fromtimestamp(fetched_at) <= day
+            and time.time() - fetched_at > TODAY_CACHE_TTL_SECONDS
+        ):
+            return None
+        return json.loads(payload)
+
+    def put(self, endpoint: str, day: date, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (endpoint, day.isoformat(), time.time(), json.dumps(payload)),
+            )
+            self._conn.commit()
+
+
+class GarminClient:
+    """Thin wrapper around garth for the data this coach needs.
+
+    Authentication order: ``GARTH_TOKEN`` environment variable first, then a
+    saved token directory at ``~/.garth`` (written by ``garth login``).
+    """
+
+    def __init__(self) -> None:
+        token = os.environ.get("GARTH_TOKEN")
+        try:
+            garth.configure(domain=GARMIN_DOMAIN)
+            if token:
+                garth.client.loads(token)
+            elif Path(GARTH_HOME).expanduser().exists():
+                garth.resume(GARTH_HOME)
+            else:
+                raise GarminAuthenticationError(
+                    "No Garmin credentials found. "
+                    "Run 'uvx garth login' or set GARTH_TOKEN."
+                )
+        except GarminAuthenticationError:
+            raise
+        except Exception as exc:
+            raise GarminAuthenticationError(
+                f"Garmin authentication failed: {exc}"
+            ) from exc
+        # A cache directory that cannot be created (read-only home, odd
+        # container setups) should degrade to network-only, not crash.
+        try:
+            self._disk_cache: _DiskCache | None = _DiskCache()
+        except (OSError, sqlite3.Error):
+            self._disk_cache = None
+        # Per-day responses are stable within one CLI invocation; memoize
+        # the bound fetchers so commands touching the same date don't
+        # repeat round trips (lru_cache is thread-safe, so this composes
+        # with the parallel dispatch in the CLI). The disk cache sits
+        # inside the memoization and persists across invocations.
+        self.get_sleep = lru_cache(maxsize=PER_DAY_CACHE_SIZE)(
+            self._disk_cached("sleep", self.get_sleep)
+        )
+        self.get_hrv = lru_cache(maxsize=PER_DAY_CACHE_SIZE)(
+            self._disk_cached("hrv", self.get_hrv)
+        )
+        self.get_body_battery = lru_cache(maxsize=PER_DAY_CACHE_SIZE)(
+            self._disk_cached("body_battery", self.get_body_battery)
+        )
+        self.get_stress = lru_cache(maxsize=PER_DAY_CACHE_SIZE)(
+            self._disk_cached("stress", self.get_stress)
+        )
+
+    def _disk_cached(
+        self,
+        endpoint: str,
+        fetch: Callable[[date | None], dict[str, Any]],
+    ) -> Callable[[date | None], dict[str, Any]]:
+        """Wrap a per-day fetcher with the on-disk response cache."""
+
+        def wrapper(target_date: date | None = None) -> dict[str, Any]:
+            day = target_date or date.today()
+            if self._disk_cache is None:
+                return fetch(day)
+            hit = self._disk_cache.get(endpoint, day)
+            if hit is not None:
+                return hit
+            result = fetch(day)
+            if not _is_empty_payload(result):
+                self._disk_cache.put(endpoint, day, result)
+            return result
+
+        return wrapper
+
+    def get_activities(self, days: int = 30) -> list[Activity]:
+        """Return normalized activities from the last ``days`` days.
+
+        The window is requested server-side via ``startDate``/``endDate``
+        and paginated, so long histories are not truncated at one page and
+        short windows are not over-fetched. The client-side cutoff check
+        stays as a safety net in case the server ignores the date params.
+        """
+        today = date.today()
+        cutoff = today - timedelta(days=days)
+        # ISO dates compare correctly as strings, so the cutoff check
+        # needs no per-activity parse; malformed or empty date strings
+        # sort below the cutoff and drop out, as before.
+        cutoff_iso = cutoff.isoformat()
+        activities: list[Activity] = []
+        start = 0
+        while True:
+            response = (
+                garth.connectapi(
+                    "/activitylist-service/activities/search/activities",
+                    params={
+                        "start": start,
+                        "limit": ACTIVITY_PAGE_LIMIT,
+                        "startDate": cutoff.isoformat(),
+                        "endDate": today.isoformat(),
+                    },
+                )
+                or []
+            )
+            for raw in response:
+                normalized = _normalize_activity(raw)
+                if normalized.date >= cutoff_iso:
+                    activities.append(normalized)
+            if len(response) < ACTIVITY_PAGE_LIMIT:
+                break
+            start += ACTIVITY_PAGE_LIMIT
+        return activities
+
+    def get_activity_details(self, activity_id: int) -> dict[str, Any]:
+        """Fetch one activity's summary plus its lap splits.
+
+        The two endpoints are independent, so both requests go out
+        concurrently and the call costs one round trip instead of two.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            detail_future = executor.submit(
+                garth.connectapi, f"/activity-service/activity/{activity_id}"
+            )
+            splits_future = executor.submit(
+                garth.connectapi, f"/activity-service/activity/{activity_id}/splits"
+            )
+        detail = detail_future.result() or {}
+        splits = splits_future.result() or {}
+        summary = detail.get("summaryDTO") or {}
+        laps: list[dict[str, Any]] = []
+        for lap in splits.get("lapDTOs") or []:
+            laps.append(
+                {
+                    "distance": float(lap.get("distance") or 0.0),
+                    "duration": float(lap.get("duration") or 0.0),
+                    "avg_hr": float(lap.get("averageHR") or 0.0),
+                }
+            )
+        return {
+            "id": activity_id,
+            "name": str(detail.get("activityName") or "Activity"),
+            "date": str(summary.get("startTimeLocal", ""))[:10],
+            "distance": float(summary.get("distance") or 0.0),
+            "duration": float(summary.get("duration") or 0.0),
+            "avg_hr": float(summary.get("averageHR") or 0.0),
+            "laps": laps,
+        }
+
+    def get_daily_bundle(self, dates: list[date]) -> dict[str, dict[str, Any]]:
+        """Fetch sleep, HRV, body battery, and stress for several dates at once.
+
+        Every per-day call is an independent round trip, so dispatching
+        them all to one thread pool drops wall time from the sum of the
+        latencies to roughly the slowest one. garth shares a single
+        authenticated session across threads, and the per-day fetchers are
+        lru_cache-wrapped (thread-safe), so concurrent dispatch is safe.
+        Returns ``{date_iso: {"sleep": ..., "hrv": ..., "body_battery": ...,
+        "stress": ...}}``.
+        """
+        fetchers = {
+            "sleep": self.get_sleep,
+            "hrv": self.get_hrv,
+            "body_battery": self.get_body_battery,
+            "stress": self.get_stress,
+        }
+        bundle: dict[str, dict[str, Any]] = {d.isoformat(): {} for d in dates}
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_FETCHES) as executor:
+            futures = {
+                (day.isoformat(), name): executor.submit(fetch, day)
+                for day in dates
+                for name, fetch in fetchers.items()
+            }
+            for (day_iso, name), future in futures.items():
+                bundle[day_iso][name] = future.result()
+        return bundle
+
+    def get_sleep(self, target_date: date | None = None) -> dict[str, Any]:
+        """Daily sleep score for a date (default today)."""
+        target_date = target_date or date.today()
+        entries = garth.DailySleep.list(target_date, 1)
+        if not entries:
+            return {"date": target_date.isoformat(), "score": 0}
+        return {
+            "date": target_date.isoformat(),
+            "score": int(entries[-1].value or 0),
+        }
+
+    def get_hrv(self, target_date: date | None = None) -> dict[str, Any]:
+        """Daily HRV summary (last night average vs weekly baseline)."""
+        target_date = target_date or date.today()
+        entries = garth.DailyHRV.list(target_date, 1)
+        if not entries:
+            return {
+                "date": target_date.isoformat(),
+                "last_night_avg": 0.0,
+                "weekly_avg": 0.0,
+                "status": "unknown",
+            }
+        entry = entries[-1]
+        return {
+            "date": target_date.isoformat(),
+            "last_night_avg": float(entry.last_night_avg or 0.0),
+            "weekly_avg": float(entry.weekly_avg or 0.0),
+            "status": str(entry.status or "unknown"),
+        }
+
+    def get_body_battery(self, target_date: date | None = None) -> dict[str, Any]:
+        """Body battery high, low, and most recent level for a date."""
+        target_date = target_date or date.today()
+        data = garth.DailyBodyBatteryStress.get(target_date)
+        samples = (data.body_battery_values_array or []) if data else []
+        # A day holds thousands of intraday samples; track high, low, and
+        # last in one pass instead of a filter list plus max/min scans.
+        high = low = current = None
+        for s in samples:
+            if not s or len(s) < 3 or not isinstance(s[2], (int, float)):
+                continue
+            level = s[2]
+            if high is None or level > high:
+                high = level
+            if low is None or level < low:
+                low = level
+            current = level
+        if current is None:
+            return {"date": target_date.isoformat(), "high": 0, "low": 0, "current": 0}
+        return {
+            "date": target_date.isoformat(),
+            "high": int(high),
+            "low": int(low),
+            "current": int(current),
+        }
+
+    def get_stress(self, target_date: date | None = None) -> dict[str, Any]:
+        """Overall daily stress level for a date."""
+        target_date = target_date or date.today()
+        entries = garth.DailyStress.list(target_date, 1)
+        if not entries:
+            return {"date": target_date.isoformat(), "overall": 0}
+        return {
+            "date": target_date.isoformat(),
+            "overall": int(entries[-1].overall_stress_level or 0),
+        }
@@ -0,0 +1,75 @@
+"""Typed activity record shared by the client and the analysis layers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class Activity:
+    """One normalized Garmin activity.
+
+    Slotted attribute access is cheaper than dict hashing in the analysis
+    loops and drops the per-object ``__dict__``; the derived ``day`` and
+    ``is_run`` fields are computed once at construction instead of once
+    per consumer. ``day`` is None when the date string is malformed.
+    """
+
+    id: Any
+    name: str
+    type: str
+    date: str
+    distance: float
+    duration: float
+    avg_hr: float
+    max_hr: float
+    day: date | None
+    is_run: bool
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "Activity":
+        """Build an Activity from an already-normalized dict."""
+        _get = raw.get
+        date_str = str(_get("date", ""))[:10]
+        try:
+            day: date | None = date.fromisoformat(date_str)
+        except ValueError:
+            day = None
+        type_str = str(_get("type", "") or "unknown")
+        return cls(
+            id=_get("id"),
+            name=str(_get("name", "") or ""),
+            type=type_str,
+            date=date_str,
+            distance=float(_get("distance", 0) or 0.0),
+            duration=float(_get("duration", 0) or 0.0),
+            avg_hr=float(_get("avg_hr", 0) or 0.0),
+            max_hr=float(_get("max_hr", 0) or 0.0),
+            day=day,
+            is_run="run" in type_str.lower(),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict for JSON serialization boundaries."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "date": self.date,
+            "distance": self.distance,
+            "duration": self.duration,
+            "avg_hr": self.avg_hr,
+            "max_hr": self.max_hr,
+        }
+
+
+def as_activities(items: list[Any]) -> list[Activity]:
+    """Coerce a list of dicts and/or Activity records to Activity records.
+
+    Lets the analysis layer accept either raw dicts (tests, ad-hoc
+    callers) or the records the client already produces, converting each
+    dict exactly once.
+    """
+    return [a if isinstance(a, Activity) else Activity.from_dict(a) for a in items]
@@ -0,0 +1,210 @@
+"""Training pattern detection across runs and recovery history."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from statistics import fmean
+from datetime import date
+from typing import Any
+
+import numpy as np
+
+from zoidberg_coach.analysis import METERS_PER_MILE, MILES_PER_METER
+from zoidberg_coach.models import as_activities
+
+MIN_RUNS_FOR_PATTERN = 2
+GOOD_SLEEP_SCORE = 70
+OVERTRAINING_PACE_SLOWDOWN_PCT = 5.0
+HRV_DECLINE_RATIO = 0.9
+RECENT_RUN_WINDOW = 10
+
+SHORT_RUN_MILES = 4.0
+LONG_RUN_MILES = 8.0
+
+_DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
+@dataclass(slots=True)
+class RunRec:
+    """One run with the derived fields every pattern helper needs.
+
+    ``pace`` is seconds per mile, or 0.0 when distance or duration is
+    missing so consumers can skip it with a single comparison.
+    """
+
+    date: date
+    date_iso: str
+    weekday: int
+    miles: float
+    duration: float
+    pace: float
+
+
+def _get_runs(activities: list[Any]) -> list[RunRec]:
+    """Filter to runs with parseable dates, precomputing derived fields.
+
+    Every pattern helper needs some mix of the parsed date, mileage, and
+    pace; computing them once here replaces five separate re-scans of the
+    activities (each redoing the pace math) with one.
+    """
+    runs: list[RunRec] = []
+    for a in as_activities(activities):
+        if not a.is_run or a.day is None:
+            continue
+        d = a.day
+        dist = a.distance
+        dur = a.duration
+        miles = dist * MILES_PER_METER
+        # Single division instead of a divide-by-quotient chain.
+        pace = dur * METERS_PER_MILE / dist if dist > 0 and dur > 0 else 0.0
+        runs.append(RunRec(d, a.date, d.weekday(), miles, dur, pace))
+    return runs
+
+
+def _day_of_week_patterns(runs: list[RunRec]) -> dict[str, Any]:
+    """Which weekdays get run on, and which tend to be fastest.
+
+    The weekday bucketing runs as ``np.bincount`` over the precomputed
+    weekday/pace arrays instead of dict-of-list accumulation; names are
+    attached only when shaping the result.
+    """
+    if not runs:
+        return {}
+    n = len(runs)
+    weekday = np.fromiter((r.weekday for r in runs), dtype=np.int64, count=n)
+    pace = np.fromiter((r.pace for r in runs), dtype=np.float64, count=n)
+
+    counts = np.bincount(weekday, minlength=7)
+    valid = pace > 0
+    pace_counts = np.bincount(weekday[valid], minlength=7)
+    pace_sums = np.bincount(weekday[valid], weights=pace[valid], minlength=7)
+    avg = pace_sums / np.maximum(pace_counts, 1)
+    eligible = pace_counts >= MIN_RUNS_FOR_PATTERN
+
+    favorite = _DAY_NAMES[int(counts.argmax())]
+    fastest = None
+    if eligible.any():
+        fastest = _DAY_NAMES[int(np.where(eligible, avg, np.inf).argmin())]
+    return {
+        "favorite_day": favorite,
+        "runs_by_day": {_DAY_NAMES[d]: int(counts[d]) for d in range(7) if counts[d]},
+        "fastest_day": fastest,
+        "avg_pace_by_day": {
+            _DAY_NAMES[d]: float(avg[d]) for d in range(7) if eligible[d]
+        },
+    }
+
+
+def _distance_pace_patterns(runs: list[RunRec]) -> dict[str, Any]:
+    """Average pace bucketed by run distance (short/medium/long)."""
+    buckets: dict[str, list[float]] = {}
+    for r in runs:
+        if r.pace <= 0:
+            continue
+        if r.miles < SHORT_RUN_MILES:
+            bucket = "short (<4 mi)"
+        elif r.miles < LONG_RUN_MILES:
+            bucket = "medium (4-8 mi)"
+        else:
+            bucket = "long (8+ mi)"
+        buckets.setdefault(bucket, []).append(r.pace)
+    return {
+        bucket: {"runs": len(paces), "avg_pace_s_per_mile": fmean(paces)}
+        for bucket, paces in buckets.items()
+    }
+
+
+def _sleep_performance_correlation(
+    runs: list[RunRec], sleep_data: list[dict[str, Any]]
+) -> dict[str, Any] | None:
+    """Compare run pace after good vs poor sleep, if there's enough data."""
+    # Only the score is ever read, so map date -> float up front instead
+    # of keeping whole sleep dicts and re-fetching "score" per run.
+    score_by_date = {
+        s["date"]: float(s.get("score", 0) or 0)
+        for s in sleep_data
+        if s and s.get("date")
+    }
+    good: list[float] = []
+    poor: list[float] = []
+    for r in runs:
+        score = score_by_date.get(r.date_iso, 0.0)
+        if score <= 0 or r.pace <= 0:
+            continue
+        if score >= GOOD_SLEEP_SCORE:
+            good.append(r.pace)
+        else:
+            poor.append(r.pace)
+    if len(good) < MIN_RUNS_FOR_PATTERN or len(poor) < MIN_RUNS_FOR_PATTERN:
+        return None
+    return {
+        "avg_pace_good_sleep": fmean(good),
+        "avg_pace_poor_sleep": fmean(poor),
+        "runs_compared": len(good) + len(poor),
+    }
+
+
+def _detect_overtraining_signals(
+    runs: list[RunRec], hrv_data: list[dict[str, Any]] | None = None
+) -> list[str]:
+    """Flag slowing paces and declining HRV across recent training."""
+    signals: list[str] = []
+    # Only the most recent runs matter; a bounded heap selection avoids
+    # sorting (and copying) the whole history. nlargest returns newest
+    # first, so reverse to keep the oldest-to-newest trend order.
+    recent = heapq.nlargest(RECENT_RUN_WINDOW, runs, key=lambda r: r.date)
+    recent.reverse()
+    paces = [r.pace for r in recent if r.pace > 0]
+    if len(paces) >= MIN_RUNS_FOR_PATTERN * 3:
+        half = len(paces) // 2
+        older = fmean(paces[:half])
+        newer = fmean(paces[half:])
+        if older > 0 and (newer - older) / older * 100.0 > OVERTRAINING_PACE_SLOWDOWN_PCT:
+            signals.append(
+                "Recent paces are trending slower — possible accumulated fatigue."
+            )
+    if hrv_data:
+        values = [
+            float(h.get("last_night_avg", 0) or 0) for h in hrv_data if h
+        ]
+        values = [v for v in values if v > 0]
+        if len(values) >= MIN_RUNS_FOR_PATTERN * 3:
+            half = len(values) // 2
+            recent_avg = fmean(values[:half])
+            older_avg = fmean(values[half:])
+            if older_avg > 0 and recent_avg < older_avg * HRV_DECLINE_RATIO:
+                signals.append("HRV trending below baseline — prioritize recovery.")
+    return signals
+
+
+def weekly_pattern_report(
+    activities: list[Any],
+    sleep_data: list[dict[str, Any]],
+    hrv_data: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build the full pattern report consumed by the ``patterns`` command."""
+    runs = _get_runs(activities)
+    if not runs:
+        return {
+            "runs_analyzed": 0,
+            "day_of_week": {},
+            "distance_pace": {},
+            "sleep_correlation": None,
+            "overtraining_signals": [],
+        }
+    return {
+        "runs_analyzed": len(runs),
+        "day_of_week": _day_of_week_patterns(runs),
+        "distance_pace": _distance_pace_patterns(runs),
+        "sleep_correlation": _sleep_performance_correlation(runs, sleep_data),
+        "overtraining_signals": _detect_overtraining_signals(runs, hrv_data),
+    }
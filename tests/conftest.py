@@ -0,0 +1,52 @@
+"""Shared fixtures for the test suite."""
+
+from datetime import date
+
+import pytest
+from typer.testing import CliRunner
+
+from zoidberg_coach.cli import app
+
+# Single source of truth for the suite's frozen clock; test modules
+# import it instead of restating the date.
+FROZEN_TODAY = date(2026, 2, 14)
+
+
+class _FrozenDate(date):
+    @classmethod
+    def today(cls):
+        return FROZEN_TODAY
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _freeze_today():
+    """Pin date.today() in the analysis module for the whole session.
+
+    The analysis tests build their fixtures against the same fixed date,
+    so week windows stay deterministic and the per-call date.today()
+    lookups disappear from the hot fixture paths.
+    """
+    monkeypatch = pytest.MonkeyPatch()
+    import zoidberg_coach.analysis as analysis
+
+    monkeypatch.setattr(analysis, "date", _FrozenDate)
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """One CliRunner for the whole session; invoke() is stateless."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_help_result(cli_runner):
+    """Memoized --help invocation shared by the read-only assertions."""
+    return cli_runner.invoke(app, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def cli_version_result(cli_runner):
+    """Memoized --version invocation shared by the read-only assertions."""
+    return cli_runner.invoke(app, ["--version"])
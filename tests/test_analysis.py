@@ -0,0 +1,236 @@
+"""Tests for the training-load analysis functions."""
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from conftest import FROZEN_TODAY
+
+from zoidberg_coach.analysis import (
+    METERS_PER_MILE,
+    RUN_DTYPE,
+    VECTORIZE_THRESHOLD,
+    _normalize_activities,
+    _weekly_totals_loop,
+    _weekly_totals_vectorized,
+    build_training_aggregate,
+    polarization_analysis,
+    training_load_trend,
+    weekly_summary,
+    weekly_summary_arr,
+)
+
+# The _freeze_today fixture pins the analysis module to FROZEN_TODAY, so
+# fixture dates computed from it land in the expected week windows. The
+# ISO table turns each _make_run date into a dict lookup instead of a
+# today()/timedelta/isoformat round trip.
+_ISO_BY_DAYS_AGO = {
+    i: (FROZEN_TODAY - timedelta(days=i)).isoformat() for i in range(31)
+}
+
+
+def _make_run(days_ago, distance_miles, duration_min, avg_hr=140, type="running"):
+    return {
+        "id": days_ago,
+        "name": "Test Run",
+        "type": type,
+        "date": _ISO_BY_DAYS_AGO[days_ago],
+        "distance": distance_miles * METERS_PER_MILE,
+        "duration": duration_min * 60.0,
+        "avg_hr": avg_hr,
+    }
+
+
+def _make_runs(specs):
+    """Batch variant of _make_run: specs is (days_ago, miles, dur_min, hr) rows.
+
+    The unit conversions happen in two NumPy broadcasts instead of one
+    Python multiply per run.
+    """
+    arr = np.asarray(specs, dtype=np.float64)
+    dists = arr[:, 1] * METERS_PER_MILE
+    durs = arr[:, 2] * 60.0
+    return [
+        {
+            "id": int(row[0]),
+            "name": "Test Run",
+            "type": "running",
+            "date": _ISO_BY_DAYS_AGO[int(row[0])],
+            "distance": float(dist),
+            "duration": float(dur),
+            "avg_hr": float(row[3]),
+        }
+        for row, dist, dur in zip(arr, dists, durs)
+    ]
+
+
+def _make_run_array(specs):
+    """Build a RUN_DTYPE structured array from the same spec rows."""
+    arr = np.asarray(specs, dtype=np.float64).reshape(-1, 4)
+    runs = np.empty(len(arr), dtype=RUN_DTYPE)
+    runs["day"] = FROZEN_TODAY.toordinal() - arr[:, 0].astype(np.int64)
+    runs["dist_m"] = arr[:, 1] * METERS_PER_MILE
+    runs["dur_s"] = arr[:, 2] * 60.0
+    runs["hr"] = arr[:, 3]
+    return runs
+
+
+# Module-scoped fixtures: the analysis functions treat their inputs as
+# read-only, so the same lists are safe to share and are built once per
+# module instead of once per test.
+@pytest.fixture(scope="module")
+def overload_summaries():
+    return [
+        {"week_start": "2026-02-09", "total_miles": 30.0, "total_seconds": 0.0, "runs": 4},
+        {"week_start": "2026-02-02", "total_miles": 20.0, "total_seconds": 0.0, "runs": 3},
+    ]
+
+
+class TestWeeklySummary:
+    def test_empty(self):
+        summaries = weekly_summary([], weeks=4)
+        assert len(summaries) == 4
+        assert all(s["total_miles"] == 0 for s in summaries)
+
+    def test_counts_recent_runs(self):
+        runs = [_make_run(0, 5.0, 50), _make_run(1, 3.0, 30)]
+        summaries = weekly_summary(runs, weeks=4)
+        assert sum(s["total_miles"] for s in summaries) == pytest.approx(8.0)
+        assert sum(s["runs"] for s in summaries) == 2
+
+    def test_ignores_non_runs(self):
+        activities = [_make_run(0, 20.0, 60, type="cycling")]
+        summaries = weekly_summary(activities, weeks=2)
+        assert all(s["total_miles"] == 0 for s in summaries)
+
+    def test_week_count(self):
+        summaries = weekly_summary([_make_run(1, 4.0, 40)], weeks=8)
+        assert len(summaries) == 8
+
+    def test_array_empty(self):
+        summaries = weekly_summary_arr(_make_run_array([]), weeks=4)
+        assert len(summaries) == 4
+        assert all(s["total_miles"] == 0 for s in summaries)
+
+    def test_array_matches_dict_path(self):
+        specs = [(0, 5.0, 50, 140), (1, 3.0, 30, 140)]
+        from_arr = weekly_summary_arr(_make_run_array(specs), weeks=4)
+        from_dicts = weekly_summary(_make_runs(specs), weeks=4)
+        assert from_arr == from_dicts
+
+
+# Each row: run specs for _make_runs, expected easy_pct bounds (or None
+# when heart rate is absent), and a required recommendation substring.
+POLARIZATION_CASES = [
+    pytest.param(
+        [(i, 5.0, 50, 130) for i in range(1, 8)],
+        (100.0, 100.0),
+        "Good polarization",
+        id="all-easy",
+    ),
+    pytest.param(
+        [(i, 5.0, 50, 130) for i in range(1, 5)]
+        + [(i, 3.0, 25, 165) for i in range(5, 7)],
+        (0.01, 99.99),
+        None,
+        id="mixed",
+    ),
+    pytest.param([(1, 5.0, 50, 0)], None, "No heart rate data", id="no-hr"),
+]
+
+
+class TestPolarization:
+    @pytest.mark.parametrize("specs,easy_bounds,rec_substring", POLARIZATION_CASES)
+    def test_polarization(self, specs, easy_bounds, rec_substring):
+        result = polarization_analysis(
+            _make_runs(specs), weeks=2, zone_boundary_hr=150
+        )
+        if easy_bounds is not None:
+            low, high = easy_bounds
+            assert low <= result["easy_pct"] <= high
+            assert result["easy_pct"] + result["hard_pct"] == pytest.approx(100.0)
+        if rec_substring is not None:
+            assert rec_substring in result["recommendation"]
+
+    def test_aggregate_boundary_mismatch_raises(self):
+        aggregate = build_training_aggregate([], weeks=2, zone_boundary_hr=150)
+        with pytest.raises(ValueError, match="zone_boundary_hr"):
+            polarization_analysis(aggregate, weeks=2, zone_boundary_hr=170)
+
+
+def _parity_specs():
+    """Deterministic spread of runs across days, distances, and HR zones."""
+    return [
+        (i % 21, 3.0 + i % 5, 30 + (i % 7) * 5, 120 + i % 60)
+        for i in range(2 * VECTORIZE_THRESHOLD)
+    ]
+
+
+class TestVectorizedParity:
+    """The >= VECTORIZE_THRESHOLD paths must agree with the plain loops."""
+
+    def test_weekly_totals_vectorized_matches_loop(self):
+        acts = _normalize_activities(_make_runs(_parity_specs()))
+        monday = FROZEN_TODAY - timedelta(days=FROZEN_TODAY.weekday())
+        sunday = monday + timedelta(days=6)
+        loop = _weekly_totals_loop(acts, sunday, 4)
+        vectorized = _weekly_totals_vectorized(acts, sunday, 4)
+        for got, expected in zip(vectorized, loop):
+            assert list(got) == pytest.approx(list(expected))
+
+    def test_weekly_summary_large_n(self):
+        specs = _parity_specs()
+        assert len(specs) >= VECTORIZE_THRESHOLD
+        summaries = weekly_summary(_make_runs(specs), weeks=4)
+        # All spec days land inside the 4-week window, so the weekly
+        # totals must add back up to the input mileage and run count.
+        assert sum(s["total_miles"] for s in summaries) == pytest.approx(
+            sum(miles for _, miles, _, _ in specs), abs=0.05
+        )
+        assert sum(s["runs"] for s in summaries) == len(specs)
+
+    def test_polarization_large_n(self):
+        specs = _parity_specs()
+        result = polarization_analysis(
+            _make_runs(specs), weeks=4, zone_boundary_hr=150
+        )
+        easy = sum(dur * 60.0 for _, _, dur, hr in specs if hr < 150)
+        hard = sum(dur * 60.0 for _, _, dur, hr in specs if hr >= 150)
+        assert result["easy_seconds"] == pytest.approx(easy)
+        assert result["hard_seconds"] == pytest.approx(hard)
+
+    def test_pace_batch_matches_scalar(self):
+        pytest.importorskip("numba")
+        from zoidberg_coach import analysis
+        from zoidberg_coach.cli import _format_pace
+
+        # The scalar path rounds its inputs before dividing, so values
+        # here are picked where that rounding cannot shift the result by
+        # a second; covers valid, zero, and sub-meter rows.
+        durations = [480.0, 0.0, 600.0, 5.0, 3600.0]
+        distances = [1609.344, 1609.344, 0.0, 0.4, 16093.44]
+        mins, secs = analysis._pace_batch(
+            np.asarray(durations), np.asarray(distances)
+        )
+        rendered = [
+            "--" if m < 0 else f"{m}:{s:02d}/mi"
+            for m, s in zip(mins.tolist(), secs.tolist())
+        ]
+        assert rendered == [
+            _format_pace(d, m) for d, m in zip(durations, distances)
+        ]
+
+
+class TestLoadTrend:
+    def test_flags_overload(self, overload_summaries):
+        trend = training_load_trend(overload_summaries)
+        assert trend[0]["overload_flag"] is True
+        assert trend[0]["mileage_increase_pct"] == pytest.approx(50.0)
+
+    def test_no_flag_on_decrease(self):
+        summaries = [
+            {"week_start": "2026-02-09", "total_miles": 18.0, "total_seconds": 0.0, "runs": 3},
+            {"week_start": "2026-02-02", "total_miles": 20.0, "total_seconds": 0.0, "runs": 3},
+        ]
+        trend = training_load_trend(summaries)
+        assert trend[0]["overload_flag"] is False
@@ -0,0 +1,60 @@
+"""Tests for the activities CLI command."""
+
+from zoidberg_coach.cli import activities, app
+from zoidberg_coach.garmin_client import GarminAuthenticationError
+from zoidberg_coach.models import Activity
+
+
+# Built once at import; Activity is frozen, so the same records are safe
+# to hand out on every call.
+_FAKE_ACTIVITIES = (
+    Activity.from_dict(
+        {
+            "id": 1001,
+            "name": "Tempo Run",
+            "type": "running",
+            "date": "2026-02-13",
+            "distance": 1609.344,
+            "duration": 480.0,
+            "avg_hr": 155.0,
+            "max_hr": 170.0,
+        }
+    ),
+)
+
+
+class _FakeClient:
+    def get_activities(self, days: int = 30):
+        return list(_FAKE_ACTIVITIES)
+
+
+class _FailingClient:
+    # Constructs fine, then fails on first use — the expired-token case.
+    def get_activities(self, days: int = 30):
+        raise GarminAuthenticationError("Authentication failed")
+
+
+def test_activities_lists_runs(cli_runner, monkeypatch):
+    # End-to-end through Click: argument parsing, context, exit code.
+    monkeypatch.setattr("zoidberg_coach.garmin_client.GarminClient", _FakeClient)
+    result = cli_runner.invoke(app, ["activities", "--days", "30"])
+    assert result.exit_code == 0
+    assert "Tempo Run" in result.stdout
+
+
+def test_activities_formats_distance_and_pace(monkeypatch, capsys):
+    # Calling the command function directly skips Click's argv plumbing;
+    # the rendered table still lands on stdout via the shared console.
+    monkeypatch.setattr("zoidberg_coach.garmin_client.GarminClient", _FakeClient)
+    activities(days=30)
+    out = capsys.readouterr().out
+    assert "Tempo Run" in out
+    assert "1.0" in out
+    assert "8:00" in out
+
+
+def test_activities_auth_error(cli_runner, monkeypatch):
+    monkeypatch.setattr("zoidberg_coach.garmin_client.GarminClient", _FailingClient)
+    result = cli_runner.invoke(app, ["activities"])
+    assert result.exit_code == 1
+    assert "Authentication failed" in result.stdout
@@ -0,0 +1,133 @@
+"""Tests for the Garmin client wrapper (no network access)."""
+
+from datetime import date, datetime
+
+import pytest
+
+from zoidberg_coach.garmin_client import GarminAuthenticationError, GarminClient
+
+
+# A plain namespace standing in for the date class: no datetime subclass
+# metaclass machinery, just the two entry points the client touches.
+_FIXED_TODAY = date(2026, 2, 14)
+_FROZEN_DATE = type(
+    "_FrozenDate",
+    (),
+    {
+        "today": staticmethod(lambda: _FIXED_TODAY),
+        "fromisoformat": staticmethod(date.fromisoformat),
+    },
+)
+
+
+@pytest.fixture(autouse=True)
+def _patch_garth(monkeypatch, tmp_path):
+    """Stub out garth auth for every test; no network, no token files.
+
+    The disk cache is pointed at tmp_path so constructing clients never
+    writes into the real ~/.cache.
+    """
+    monkeypatch.setenv("GARTH_TOKEN", "test-token")
+    monkeypatch.setenv("ZOIDBERG_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "zoidberg_coach.garmin_client.garth.configure", lambda **kwargs: None
+    )
+    monkeypatch.setattr(
+        "zoidberg_coach.garmin_client.garth.client.loads", lambda token: None
+    )
+
+
+def test_uses_env_token(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "zoidberg_coach.garmin_client.garth.configure",
+        lambda **kwargs: calls.append(("configure", kwargs.get("domain"))),
+    )
+    monkeypatch.setattr(
+        "zoidberg_coach.garmin_client.garth.client.loads",
+        lambda token: calls.append(("loads", token)),
+    )
+    GarminClient()
+    assert ("configure", "garmin.com") in calls
+    assert ("loads", "test-token") in calls
+
+
+def test_missing_credentials_raise(monkeypatch):
+    class _MissingPath:
+        def __init__(self, *args):
+            pass
+
+        def expanduser(self):
+            return self
+
+        def exists(self):
+            return False
+
+    monkeypatch.delenv("GARTH_TOKEN")
+    monkeypatch.setattr("zoidberg_coach.garmin_client.Path", _MissingPath)
+    with pytest.raises(GarminAuthenticationError):
+        GarminClient()
+
+
+def test_disk_cache_expires_same_day_snapshots(monkeypatch, tmp_path):
+    from zoidberg_coach.garmin_client import _DiskCache
+
+    cache = _DiskCache(tmp_path)
+    day = date(2026, 2, 14)
+    noon = datetime(2026, 2, 14, 12, 0).timestamp()
+    payload = {"date": "2026-02-14", "score": 80}
+
+    def at(timestamp):
+        monkeypatch.setattr(
+            "zoidberg_coach.garmin_client.time.time", lambda: timestamp
+        )
+
+    # A snapshot taken mid-day is served within the TTL...
+    at(noon)
+    cache.put("sleep", day, payload)
+    at(noon + 60)
+    assert cache.get("sleep", day) == payload
+    # ...but stays expired after the date rolls over: it was partial.
+    at(noon + 86400)
+    assert cache.get("sleep", day) is None
+    # A payload fetched the day after is final and never expires.
+    cache.put("sleep", day, payload)
+    at(noon + 30 * 86400)
+    assert cache.get("sleep", day) == payload
+
+
+def test_get_activities_normalizes_and_filters(monkeypatch):
+    payload = [
+        {
+            "activityId": 1,
+            "activityName": "Recent Run",
+            "activityType": {"typeKey": "running"},
+            "startTimeLocal": "2026-02-13 07:00:00",
+            "distance": 8046.72,
+            "duration": 2400.0,
+            "averageHR": 150.0,
+            "maxHR": 165.0,
+        },
+        {
+            "activityId": 2,
+            "activityName": "Old Run",
+            "activityType": {"typeKey": "running"},
+            "startTimeLocal": "2025-11-01 07:00:00",
+            "distance": 5000.0,
+            "duration": 1500.0,
+        },
+    ]
+
+    monkeypatch.setattr(
+        "zoidberg_coach.garmin_client.garth.connectapi",
+        lambda path, **kwargs: payload,
+    )
+    monkeypatch.setattr("zoidberg_coach.garmin_client.date", _FROZEN_DATE)
+
+    client = GarminClient()
+    activities = client.get_activities(days=30)
+    assert [a.id for a in activities] == [1]
+    assert activities[0].type == "running"
+    assert activities[0].date == "2026-02-13"
+    assert activities[0].avg_hr == 150.0
+    assert activities[0].is_run
@@ -0,0 +1,136 @@
+"""Tests for training pattern detection."""
+
+import pytest
+
+from zoidberg_coach.analysis import METERS_PER_MILE
+from zoidberg_coach.patterns import (
+    _day_of_week_patterns,
+    _detect_overtraining_signals,
+    _get_runs,
+    _sleep_performance_correlation,
+    weekly_pattern_report,
+)
+
+
+def _activity(date_iso, miles, dur_min, type="running"):
+    return {
+        "id": date_iso,
+        "name": "Test Run",
+        "type": type,
+        "date": date_iso,
+        "distance": miles * METERS_PER_MILE,
+        "duration": dur_min * 60.0,
+    }
+
+
+class TestGetRuns:
+    def test_filters_and_derives(self):
+        acts = [
+            _activity("2026-02-09", 5.0, 50),
+            _activity("2026-02-10", 20.0, 60, type="cycling"),
+            _activity("not-a-date", 5.0, 50),
+        ]
+        runs = _get_runs(acts)
+        assert len(runs) == 1
+        run = runs[0]
+        assert run.weekday == 0  # 2026-02-09 is a Monday
+        assert run.miles == pytest.approx(5.0)
+        assert run.pace == pytest.approx(600.0)
+
+    def test_zero_distance_marks_pace_invalid(self):
+        runs = _get_runs([_activity("2026-02-09", 0.0, 30)])
+        assert runs[0].pace == 0.0
+
+
+class TestDayOfWeekPatterns:
+    def test_empty(self):
+        assert _day_of_week_patterns([]) == {}
+
+    def test_favorite_and_fastest(self):
+        # Three Monday runs at 600 s/mi, two faster Wednesday runs at 540.
+        runs = _get_runs(
+            [
+                _activity("2026-01-26", 5.0, 50),
+                _activity("2026-02-02", 5.0, 50),
+                _activity("2026-02-09", 5.0, 50),
+                _activity("2026-01-28", 5.0, 45),
+                _activity("2026-02-04", 5.0, 45),
+            ]
+        )
+        result = _day_of_week_patterns(runs)
+        assert result["favorite_day"] == "Monday"
+        assert result["fastest_day"] == "Wednesday"
+        assert result["runs_by_day"] == {"Monday": 3, "Wednesday": 2}
+        assert result["avg_pace_by_day"]["Wednesday"] == pytest.approx(540.0)
+
+    def test_single_runs_not_eligible_for_fastest(self):
+        runs = _get_runs([_activity("2026-02-09", 5.0, 50)])
+        result = _day_of_week_patterns(runs)
+        assert result["favorite_day"] == "Monday"
+        assert result["fastest_day"] is None
+
+
+class TestSleepCorrelation:
+    def test_requires_enough_data(self):
+        runs = _get_runs([_activity("2026-02-09", 5.0, 50)])
+        assert _sleep_performance_correlation(runs, []) is None
+
+    def test_splits_good_and_poor_sleep(self):
+        runs = _get_runs(
+            [
+                _activity("2026-02-05", 5.0, 45),
+                _activity("2026-02-06", 5.0, 45),
+                _activity("2026-02-07", 5.0, 50),
+                _activity("2026-02-08", 5.0, 50),
+            ]
+        )
+        sleep_data = [
+            {"date": "2026-02-05", "score": 85},
+            {"date": "2026-02-06", "score": 80},
+            {"date": "2026-02-07", "score": 50},
+            {"date": "2026-02-08", "score": 40},
+        ]
+        result = _sleep_performance_correlation(runs, sleep_data)
+        assert result["avg_pace_good_sleep"] == pytest.approx(540.0)
+        assert result["avg_pace_poor_sleep"] == pytest.approx(600.0)
+        assert result["runs_compared"] == 4
+
+
+class TestOvertrainingSignals:
+    def _runs(self, dur_mins):
+        # Consecutive days, oldest first; constant 5-mile distance.
+        return _get_runs(
+            [
+                _activity(f"2026-02-{3 + i:02d}", 5.0, dur)
+                for i, dur in enumerate(dur_mins)
+            ]
+        )
+
+    def test_no_signals_on_stable_training(self):
+        assert _detect_overtraining_signals(self._runs([50] * 6)) == []
+
+    def test_flags_slowing_paces(self):
+        # Newer half 11% slower than the older half.
+        signals = _detect_overtraining_signals(self._runs([45, 45, 45, 50, 50, 50]))
+        assert any("slower" in s for s in signals)
+
+    def test_flags_hrv_decline(self):
+        # History is newest first; recent half well below the older half.
+        hrv_data = [{"last_night_avg": v} for v in (44, 45, 46, 55, 56, 57)]
+        signals = _detect_overtraining_signals(self._runs([50] * 6), hrv_data)
+        assert any("HRV" in s for s in signals)
+
+
+def test_report_empty():
+    report = weekly_pattern_report([], [])
+    assert report["runs_analyzed"] == 0
+    assert report["overtraining_signals"] == []
+
+
+def test_report_shape():
+    report = weekly_pattern_report(
+        [_activity("2026-02-09", 5.0, 50)], [], []
+    )
+    assert report["runs_analyzed"] == 1
+    assert report["day_of_week"]["favorite_day"] == "Monday"
+    assert report["sleep_correlation"] is None
@@ -0,0 +1,161 @@
+"""Tests for readiness scoring and workout suggestions."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from zoidberg_coach.analysis import METERS_PER_MILE
+from zoidberg_coach.coaching import race_readiness, readiness_score, suggest_workout
+
+
+def _run(days_ago, miles, dur_min):
+    return {
+        "id": days_ago,
+        "name": "Test Run",
+        "type": "running",
+        "date": (date.today() - timedelta(days=days_ago)).isoformat(),
+        "distance": miles * METERS_PER_MILE,
+        "duration": dur_min * 60.0,
+    }
+
+READINESS_CASES = [
+    pytest.param(
+        dict(
+            sleep_score=90,
+            hrv_last_night=60,
+            hrv_baseline=58,
+            body_battery=85,
+            stress_avg=25,
+            days_since_hard=2,
+        ),
+        (70, 100),
+        {"Normal training", "Ready for hard effort"},
+        id="high",
+    ),
+    pytest.param(
+        dict(
+            sleep_score=30,
+            hrv_last_night=35,
+            hrv_baseline=60,
+            body_battery=15,
+            stress_avg=80,
+            days_since_hard=1,
+        ),
+        (0, 50),
+        {"Rest day recommended"},
+        id="low",
+    ),
+    pytest.param(
+        dict(
+            sleep_score=70,
+            hrv_last_night=55,
+            hrv_baseline=60,
+            body_battery=60,
+            stress_avg=50,
+            days_since_hard=2,
+        ),
+        (50, 79),
+        {"Normal training"},
+        id="moderate",
+    ),
+]
+
+
+class TestReadinessScore:
+    @pytest.mark.parametrize("kwargs,score_range,interpretations", READINESS_CASES)
+    def test_score_bands(self, kwargs, score_range, interpretations):
+        result = readiness_score(**kwargs)
+        low, high = score_range
+        assert low <= result["score"] <= high
+        assert result["interpretation"] in interpretations
+
+    def test_hard_effort_today_lowers_score(self):
+        kwargs = dict(
+            sleep_score=80,
+            hrv_last_night=60,
+            hrv_baseline=58,
+            body_battery=85,
+            stress_avg=25,
+        )
+        rested = readiness_score(**kwargs, days_since_hard=2)
+        raced = readiness_score(**kwargs, days_since_hard=0)
+        assert raced["score"] < rested["score"]
+
+
+class TestSuggestWorkout:
+    @pytest.mark.parametrize(
+        "readiness,days_since_hard,expected",
+        [
+            pytest.param(30, 3, "Rest day", id="rest-when-low"),
+            pytest.param(50, 3, "Recovery run", id="recovery-when-below-normal"),
+            pytest.param(85, 1, "Easy run", id="easy-after-hard-effort"),
+            pytest.param(85, 3, "Tempo run", id="quality-when-ready"),
+        ],
+    )
+    def test_workout_ladder(self, readiness, days_since_hard, expected):
+        assert suggest_workout(readiness, [], days_since_hard)["workout"] == expected
+
+
+class TestRaceReadiness:
+    """Covers the wrapper on whichever backend is installed — the NumPy
+    fallback on a stock install, the kernel with the perf extra."""
+
+    def test_empty(self):
+        result = race_readiness([])
+        assert result["readiness_pct"] == 0.0
+        assert result["best_pace_s_per_mile"] is None
+        assert result["notes"] == ["No recent runs found."]
+
+    def test_metrics_over_recent_runs(self):
+        acts = [
+            _run(2, 11.0, 100),
+            _run(9, 6.0, 60),
+            _run(16, 5.0, 50),
+            _run(16, 2.0, 30),  # below the best-pace distance floor
+            _run(70, 12.0, 110),  # outside the 8-week window
+        ]
+        result = race_readiness(acts)
+        assert result["longest_run_miles"] == pytest.approx(11.0)
+        assert result["avg_weekly_miles"] == pytest.approx(6.0)
+        assert result["best_pace_s_per_mile"] == pytest.approx(6000.0 / 11.0)
+        # Long-run target met; volume at 6 of the 25-mile target.
+        expected_pct = round((0.5 * 1.0 + 0.5 * (6.0 / 25.0)) * 100.0, 1)
+        assert result["readiness_pct"] == pytest.approx(expected_pct)
+        assert any("weekly volume" in note for note in result["notes"])
+
+    def test_taper_note_inside_two_weeks(self):
+        result = race_readiness(
+            [_run(2, 11.0, 100)], race_date=date.today() + timedelta(days=10)
+        )
+        assert any("taper" in note.lower() for note in result["notes"])
+
+
+def test_race_metrics_kernel_matches_numpy():
+    """The compiled race kernel must agree with the NumPy fallback math."""
+    pytest.importorskip("numba")
+    import numpy as np
+
+    from zoidberg_coach.analysis import MILES_PER_METER
+    from zoidberg_coach.coaching import MIN_RACE_PACE_DISTANCE_MILES, _race_metrics
+
+    today_ord = date(2026, 2, 14).toordinal()
+    # Meters/seconds pairs spanning the 4-week window plus one stale run
+    # and one below the best-pace distance floor.
+    dist = np.array([16093.44, 8046.72, 12874.752, 3218.688, 16093.44])
+    dur = np.array([6000.0, 2400.0, 4500.0, 1200.0, 5400.0])
+    ords = today_ord - np.array([0, 3, 10, 27, 30], dtype=np.int64)
+
+    longest, weekly, best = _race_metrics(
+        dist, dur, ords, today_ord, MIN_RACE_PACE_DISTANCE_MILES
+    )
+
+    miles = dist * MILES_PER_METER
+    assert longest == pytest.approx(float(miles.max()))
+    week_idx = (today_ord - ords) // 7
+    in_window = (week_idx >= 0) & (week_idx < 4)
+    expected_weekly = np.bincount(
+        week_idx[in_window], weights=miles[in_window], minlength=4
+    )
+    np.testing.assert_allclose(weekly, expected_weekly)
+    pace_mask = (miles >= MIN_RACE_PACE_DISTANCE_MILES) & (dur > 0)
+    assert best == pytest.approx(float((dur[pace_mask] / miles[pace_mask]).min()))
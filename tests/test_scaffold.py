@@ -0,0 +1,48 @@
+"""Smoke tests for CLI entrypoint wiring."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from zoidberg_coach.cli import app
+
+
+def test_cli_help_runs(cli_help_result):
+    assert cli_help_result.exit_code == 0
+    assert "usage" in cli_help_result.stdout.lower()
+
+
+def test_cli_version_flag(cli_version_result):
+    assert cli_version_result.exit_code == 0
+    assert "0.1.0" in cli_version_result.stdout
+
+
+def test_no_args_shows_help(cli_runner):
+    result = cli_runner.invoke(app, [])
+    assert "usage" in result.stdout.lower()
+
+
+# The only thing the in-process tests cannot cover: that
+# ``python -m zoidberg_coach`` actually wires up to the Typer app. One
+# session-scoped spawn serves every entrypoint assertion, so adding more
+# checks against it never costs another interpreter startup.
+@pytest.fixture(scope="session")
+def module_entrypoint_result():
+    # -I (isolated mode) skips user site-packages, PYTHONPATH scanning,
+    # and cwd prepending, trimming interpreter startup; the slim env
+    # keeps the child from re-reading our PYTHON* configuration.
+    return subprocess.run(
+        [sys.executable, "-I", "-m", "zoidberg_coach", "--version"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+        env={"PATH": os.environ.get("PATH", ""), "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+
+
+@pytest.mark.slow
+def test_module_entrypoint_spawns(module_entrypoint_result):
+    assert module_entrypoint_result.returncode == 0
+    assert "0.1.0" in module_entrypoint_result.stdout